@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Consolidate Garmin daily health data into a single token-efficient file.
 
-Reads ~/garmin_data/daily/{YYYY-MM-DD}/*.json and ~/garmin_data/activities/*.json
-and produces a single combined file:
+Reads ~/garmin_data/daily/{YYYY-MM-DD}.msgpack.zst (or the legacy
+uncompressed .msgpack / {YYYY-MM-DD}/*.json layouts) and
+~/garmin_data/activities/{YYYY-MM}.ndjson logs (plus legacy per-activity
+*.json files) and produces a single combined file:
   ~/garmin_data/claude_summary/garmin_data.csv
 
 The file contains a header with instructions for Claude, followed by two CSV
@@ -17,6 +19,14 @@ import io
 import json
 from pathlib import Path
 
+import msgspec
+import zstandard as zstd
+
+dctx = zstd.ZstdDecompressor()
+
+# Pre-compiled decoder reused for every bundle/archive read
+mp_decoder = msgspec.msgpack.Decoder()
+
 GARMIN_DATA = Path.home() / "garmin_data"
 DAILY_DIR = GARMIN_DATA / "daily"
 ACTIVITIES_DIR = GARMIN_DATA / "activities"
@@ -172,6 +182,22 @@ def load_json(path: Path):
         return None
 
 
+def iter_ndjson(path: Path):
+    """Yield JSON records from an NDJSON log, skipping blank/bad lines."""
+    try:
+        with open(path, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+    except FileNotFoundError:
+        return
+
+
 def g(data, *keys):
     """Safely get a nested value from dicts/lists."""
     for k in keys:
@@ -184,13 +210,41 @@ def g(data, *keys):
     return data
 
 
-def extract_daily(date_dir: Path) -> dict:
-    """Extract one row of daily metrics from a date folder."""
-    date_str = date_dir.name
+def load_day(date_str: str) -> dict:
+    """Load one day's endpoint payloads as {endpoint: data}.
+
+    Prefers the compressed daily/{date}.msgpack.zst bundle; falls back to
+    the uncompressed .msgpack and legacy daily/{date}/*.json layouts.
+    """
+    zst_path = DAILY_DIR / f"{date_str}.msgpack.zst"
+    if zst_path.exists():
+        try:
+            return mp_decoder.decode(dctx.decompress(zst_path.read_bytes()))
+        except (msgspec.DecodeError, zstd.ZstdError):
+            return {}
+    msgpack_path = DAILY_DIR / f"{date_str}.msgpack"
+    if msgpack_path.exists():
+        try:
+            return mp_decoder.decode(msgpack_path.read_bytes())
+        except msgspec.DecodeError:
+            return {}
+    day = {}
+    day_dir = DAILY_DIR / date_str
+    if day_dir.is_dir():
+        for f in day_dir.glob("*.json"):
+            data = load_json(f)
+            if data is not None:
+                day[f.stem] = data
+    return day
+
+
+def extract_daily(date_str: str) -> dict:
+    """Extract one row of daily metrics for a date."""
+    day = load_day(date_str)
     row = {"date": date_str}
 
-    # summary.json
-    s = load_json(date_dir / "summary.json")
+    # summary
+    s = day.get("summary")
     if s:
         row["steps"] = g(s, "totalSteps")
         row["distance_m"] = g(s, "totalDistanceMeters")
@@ -218,8 +272,8 @@ def extract_daily(date_dir: Path) -> dict:
         row["avg_spo2"] = g(s, "averageSpo2")
         row["lowest_spo2"] = g(s, "lowestSpo2")
 
-    # sleep.json
-    sl = load_json(date_dir / "sleep.json")
+    # sleep
+    sl = day.get("sleep")
     if sl:
         d = g(sl, "dailySleepDTO") or {}
         row["sleep_s"] = g(d, "sleepTimeSeconds")
@@ -235,8 +289,8 @@ def extract_daily(date_dir: Path) -> dict:
         row["sleep_avg_resp"] = g(d, "averageRespirationValue")
         row["sleep_skin_temp_dev_c"] = g(d, "avgSkinTempDeviationC")
 
-    # hrv.json
-    h = load_json(date_dir / "hrv.json")
+    # hrv
+    h = day.get("hrv")
     if h:
         hs = g(h, "hrvSummary") or {}
         row["hrv_weekly_avg"] = g(hs, "weeklyAvg")
@@ -244,14 +298,14 @@ def extract_daily(date_dir: Path) -> dict:
         row["hrv_5min_high"] = g(hs, "lastNight5MinHigh")
         row["hrv_status"] = g(hs, "status")
 
-    # body_battery.json (list)
-    bb = load_json(date_dir / "body_battery.json")
+    # body_battery (list)
+    bb = day.get("body_battery")
     if bb and isinstance(bb, list) and len(bb) > 0:
         row["bb_charged"] = row.get("bb_charged") or g(bb, 0, "charged")
         row["bb_drained"] = row.get("bb_drained") or g(bb, 0, "drained")
 
-    # training_readiness.json (list — take AFTER_WAKEUP_RESET or first entry)
-    tr = load_json(date_dir / "training_readiness.json")
+    # training_readiness (list — take AFTER_WAKEUP_RESET or first entry)
+    tr = day.get("training_readiness")
     if tr and isinstance(tr, list) and len(tr) > 0:
         best = None
         for entry in tr:
@@ -264,21 +318,21 @@ def extract_daily(date_dir: Path) -> dict:
         row["tr_level"] = g(best, "level")
         row["tr_recovery_time"] = g(best, "recoveryTime")
 
-    # hydration.json
-    hy = load_json(date_dir / "hydration.json")
+    # hydration
+    hy = day.get("hydration")
     if hy:
         row["hydration_ml"] = g(hy, "valueInML")
         row["hydration_goal_ml"] = g(hy, "goalInML")
         row["sweat_loss_ml"] = g(hy, "sweatLossInML")
 
-    # stress.json
-    st = load_json(date_dir / "stress.json")
+    # stress
+    st = day.get("stress")
     if st:
         row["stress_avg"] = g(st, "avgStressLevel")
         row["stress_max"] = g(st, "maxStressLevel")
 
-    # respiration.json
-    rp = load_json(date_dir / "respiration.json")
+    # respiration
+    rp = day.get("respiration")
     if rp:
         row["resp_avg_waking"] = g(rp, "avgWakingRespirationValue")
         row["resp_avg_sleep"] = g(rp, "avgSleepRespirationValue")
@@ -286,9 +340,8 @@ def extract_daily(date_dir: Path) -> dict:
     return row
 
 
-def extract_activity(filepath: Path) -> dict | None:
-    """Extract one row of activity data from a {id}.json file."""
-    data = load_json(filepath)
+def extract_activity(data: dict) -> dict | None:
+    """Extract one row of activity data from a stored activity record."""
     if not data:
         return None
 
@@ -472,9 +525,16 @@ def process_daily(state: dict) -> tuple[list[dict], int]:
         return existing_rows, 0
 
     processed = set(state.get("processed_dates", []))
-    all_dates = sorted(
-        d.name for d in DAILY_DIR.iterdir() if d.is_dir() and d.name[:4].isdigit()
-    )
+    all_dates = set()
+    for entry in DAILY_DIR.iterdir():
+        name = entry.name
+        if entry.is_dir() and name[:4].isdigit():
+            all_dates.add(name)
+        elif name.endswith(".msgpack.zst"):
+            all_dates.add(name[: -len(".msgpack.zst")])
+        elif name.endswith(".msgpack"):
+            all_dates.add(name[: -len(".msgpack")])
+    all_dates = sorted(all_dates)
     new_dates = [d for d in all_dates if d not in processed]
 
     if not new_dates:
@@ -483,7 +543,7 @@ def process_daily(state: dict) -> tuple[list[dict], int]:
 
     new_rows = []
     for date_str in new_dates:
-        row = extract_daily(DAILY_DIR / date_str)
+        row = extract_daily(date_str)
         new_rows.append(row)
 
     all_rows = existing_rows + new_rows
@@ -505,26 +565,54 @@ def process_activities(state: dict) -> tuple[list[dict], int]:
         return existing_rows, 0
 
     processed = set(state.get("processed_activities", []))
-    all_files = sorted(
-        f.stem for f in ACTIVITIES_DIR.iterdir()
-        if f.is_file() and f.suffix == ".json"
-    )
-    new_ids = [fid for fid in all_files if fid not in processed]
+    new_ids = set()
+    new_rows = []
+
+    # Per-year archives of completed years
+    for archive in sorted(ACTIVITIES_DIR.glob("*.msgpack")):
+        if not archive.stem.isdigit():
+            continue
+        try:
+            records = mp_decoder.decode(archive.read_bytes())
+        except msgspec.DecodeError:
+            continue
+        for aid, data in records.items():
+            if aid in processed or aid in new_ids:
+                continue
+            row = extract_activity(data)
+            if row:
+                new_rows.append(row)
+            new_ids.add(aid)
+
+    # Append-only monthly logs
+    for log in sorted(ACTIVITIES_DIR.glob("*.ndjson")):
+        for data in iter_ndjson(log):
+            aid = data.get("activityId")
+            aid = str(aid) if aid is not None else None
+            if not aid or aid in processed or aid in new_ids:
+                continue
+            row = extract_activity(data)
+            if row:
+                new_rows.append(row)
+            new_ids.add(aid)
+
+    # Legacy per-activity files
+    for f in sorted(ACTIVITIES_DIR.glob("*.json")):
+        if f.stem in processed or f.stem in new_ids:
+            continue
+        row = extract_activity(load_json(f))
+        if row:
+            new_rows.append(row)
+        new_ids.add(f.stem)
 
     if not new_ids:
         print("Activities: 0 new activities to process")
         return existing_rows, 0
 
-    new_rows = []
-    for fid in new_ids:
-        row = extract_activity(ACTIVITIES_DIR / f"{fid}.json")
-        if row:
-            new_rows.append(row)
-
     all_rows = existing_rows + new_rows
     all_rows.sort(key=lambda r: r.get("date") or "")
 
-    state["processed_activities"] = sorted(processed | set(new_ids))
+    state["processed_activities"] = sorted(processed | new_ids)
     print(f"Activities: processed {len(new_ids)} new activities")
     return all_rows, len(new_ids)
 
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 """Garmin Connect Data Sync Script.
 
-Pulls health/fitness data from Garmin Connect and stores it locally
-in ~/garmin_data/ as organized JSON files.
+Pulls health/fitness data from Garmin Connect and stores it locally in
+~/garmin_data/: compressed per-day bundles, append-only activity logs,
+and JSON files for the smaller one-off payloads.
 
 First run: pulls 365 days of history.
 Subsequent runs: incremental sync from last sync date.
@@ -12,17 +13,25 @@ Environment Variables (optional):
     PASSWORD - Garmin Connect password
 """
 
-import json
+import asyncio
+import functools
 import logging
 import os
+import random
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from getpass import getpass
 from pathlib import Path
 
+import msgspec
+import orjson
 import requests
+import zstandard as zstd
+from aiolimiter import AsyncLimiter
 from garth.exc import GarthException, GarthHTTPError
+from requests.adapters import HTTPAdapter
 
 from garminconnect import (
     Garmin,
@@ -33,24 +42,94 @@ from garminconnect import (
 
 logging.getLogger("garminconnect").setLevel(logging.CRITICAL)
 
+TOKENSTORE = Path(os.getenv("GARMINTOKENS", "~/.garminconnect")).expanduser()
+
 BASE_DIR = Path.home() / "garmin_data"
+DAILY_DIR = BASE_DIR / "daily"
+ACTIVITIES_DIR = BASE_DIR / "activities"
+ACTIVITY_INDEX_FILE = ACTIVITIES_DIR / "index.msgpack"
+BODY_COMP_DIR = BASE_DIR / "body_composition"
+WEEKLY_DIR = BASE_DIR / "weekly"
+PROFILE_DIR = BASE_DIR / "profile"
+PERSONAL_RECORDS_FILE = BASE_DIR / "personal_records.json"
 SYNC_STATE_FILE = BASE_DIR / "sync_state.json"
 HISTORY_DAYS = 365
-API_DELAY = 1.0
+MAX_CONCURRENCY = 8
+
+# Per-day endpoints, resolved once at import time as unbound methods;
+# each is invoked as method(api, date_str).
+DAILY_ENDPOINTS = [
+    ("summary", Garmin.get_user_summary),
+    ("heart_rate", Garmin.get_heart_rates),
+    ("sleep", Garmin.get_sleep_data),
+    ("stress", Garmin.get_all_day_stress),
+    ("respiration", Garmin.get_respiration_data),
+    ("spo2", Garmin.get_spo2_data),
+    ("hrv", Garmin.get_hrv_data),
+    ("training_readiness", Garmin.get_training_readiness),
+    ("hydration", Garmin.get_hydration_data),
+    ("intensity_minutes", Garmin.get_intensity_minutes_data),
+    ("floors", Garmin.get_floors),
+    ("steps_detail", Garmin.get_steps_data),
+    # body_battery takes start+end date params; bind them to one date
+    ("body_battery", lambda api, d: api.get_body_battery(d, d)),
+]
 MAX_RETRIES = 3
 RETRY_BACKOFF = 5
 
+# Token bucket shared by every API call: allows bursting up to 30 calls,
+# then settles at 30 calls/minute. Lower max_rate if Garmin starts
+# returning 429s.
+limiter = AsyncLimiter(30, 60)
+
+# Background pool for file writes so the fetch loop never blocks on disk.
+# main_async() drains it and checks every future before saving sync
+# state, so a failed write can't be recorded as synced.
+writer = ThreadPoolExecutor(max_workers=4, thread_name_prefix="writer")
+pending_writes: list[Future] = []
+
+
+def submit_write(fn, *args):
+    """Submit a background write, keeping its future for the final flush."""
+    pending_writes.append(writer.submit(fn, *args))
+
+# Reusable zstd contexts for the compressed daily bundles
+cctx = zstd.ZstdCompressor(level=6)
+dctx = zstd.ZstdDecompressor()
+
+# Pre-compiled msgspec codecs. Decoding bundle/archive payloads to
+# msgspec.Raw leaves them as opaque bytes, so key-only reads (partial-day
+# skip checks, index scans) never materialize the payloads; Raw values
+# round-trip through the encoder untouched.
+raw_map_decoder = msgspec.msgpack.Decoder(dict[str, msgspec.Raw])
+id_list_decoder = msgspec.msgpack.Decoder(list[str])
+mp_encoder = msgspec.msgpack.Encoder()
+
+
+def mount_pooled_adapter(garmin: Garmin):
+    """Enlarge the keep-alive connection pool on garth's requests.Session.
+
+    The default adapter pools only 10 connections; with the concurrent
+    daily fetches that means extra TCP+TLS handshakes. A bigger pool lets
+    all ~5k calls of an initial sync reuse warm connections.
+    """
+    sess = getattr(garmin.garth, "sess", None)
+    if sess is None:
+        return
+    sess.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=50))
+    sess.headers["Connection"] = "keep-alive"
+
 
 def init_api() -> Garmin | None:
     """Initialize Garmin API with token reuse and credential fallback."""
-    tokenstore = os.getenv("GARMINTOKENS", "~/.garminconnect")
-    tokenstore_path = Path(tokenstore).expanduser()
+    tokenstore_path = TOKENSTORE
 
     # Try stored tokens first
     try:
         garmin = Garmin()
         garmin.login(str(tokenstore_path))
         print("Authenticated with stored tokens.")
+        mount_pooled_adapter(garmin)
         return garmin
     except (FileNotFoundError, GarthHTTPError, GarminConnectAuthenticationError,
             GarminConnectConnectionError):
@@ -70,10 +149,11 @@ def init_api() -> Garmin | None:
                 try:
                     garmin.resume_login(result2, mfa_code)
                 except GarthHTTPError as e:
-                    if "429" in str(e):
+                    code = http_status(e)
+                    if code == 429:
                         print("Rate limited during MFA. Try again later.")
                         sys.exit(1)
-                    elif "401" in str(e) or "403" in str(e):
+                    elif code in (401, 403):
                         print("Invalid MFA code. Try again.")
                         continue
                     else:
@@ -84,6 +164,7 @@ def init_api() -> Garmin | None:
 
             garmin.garth.dump(str(tokenstore_path))
             print("Authenticated successfully.")
+            mount_pooled_adapter(garmin)
             return garmin
 
         except GarminConnectAuthenticationError:
@@ -97,18 +178,89 @@ def init_api() -> Garmin | None:
             return None
 
 
+def _http_response(e):
+    """Walk an exception and its causes to find the underlying HTTP response.
+
+    garth nests the response under e.error.response, and garminconnect
+    wraps the garth error again via `raise ... from e`, so follow the
+    __cause__ chain until a response turns up.
+    """
+    for _ in range(5):
+        if e is None:
+            return None
+        resp = getattr(getattr(e, "error", None), "response", None)
+        if resp is None:
+            resp = getattr(e, "response", None)
+        if resp is not None:
+            return resp
+        e = e.__cause__
+    return None
+
+
+def http_status(e) -> int | None:
+    """Best-effort HTTP status code from a garth/garminconnect exception."""
+    return getattr(_http_response(e), "status_code", None)
+
+
+def retry_wait(e, attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited call.
+
+    Honors the server's Retry-After header when present; otherwise falls
+    back to jittered exponential backoff.
+    """
+    resp = _http_response(e)
+    header = getattr(resp, "headers", {}).get("Retry-After")
+    if header:
+        try:
+            return max(int(header), 1)
+        except ValueError:
+            pass
+    return random.uniform(0.5, 1.5) * RETRY_BACKOFF * (2 ** attempt)
+
+
+def refresh_auth(api_method, args) -> bool:
+    """Refresh the OAuth2 token in-process after a 401. Returns True on success."""
+    owner = getattr(api_method, "__self__", None)
+    if owner is None and args and isinstance(args[0], Garmin):
+        # Unbound method from DAILY_ENDPOINTS; the api is the first arg
+        owner = args[0]
+    garth_client = getattr(owner, "garth", None)
+    if garth_client is None:
+        return False
+    try:
+        garth_client.refresh_oauth2()
+        garth_client.dump(str(TOKENSTORE))
+        print("  Auth token refreshed.")
+        return True
+    except Exception as e:
+        print(f"  Token refresh failed: {e}")
+        return False
+
+
 def api_call(api_method, *args, **kwargs):
     """Call an API method with retry on rate limiting. Returns result or None."""
+    refreshed = False
     for attempt in range(MAX_RETRIES):
         try:
             result = api_method(*args, **kwargs)
             return result
-        except (GarminConnectTooManyRequestsError, GarthHTTPError) as e:
-            if "429" in str(e) or isinstance(e, GarminConnectTooManyRequestsError):
-                wait = RETRY_BACKOFF * (attempt + 1)
-                print(f"  Rate limited, waiting {wait}s...")
+        except (
+            GarminConnectAuthenticationError,
+            GarminConnectConnectionError,
+            GarminConnectTooManyRequestsError,
+            GarthHTTPError,
+        ) as e:
+            code = http_status(e)
+            if code == 429 or isinstance(e, GarminConnectTooManyRequestsError):
+                wait = retry_wait(e, attempt)
+                print(f"  Rate limited, waiting {wait:.0f}s...")
                 time.sleep(wait)
                 continue
+            # Expired token mid-run: refresh once in-process and retry
+            expired = code == 401 or isinstance(e, GarminConnectAuthenticationError)
+            if expired and not refreshed and refresh_auth(api_method, args):
+                refreshed = True
+                continue
             return None
         except Exception as e:
             print(f"  Warning: {e}")
@@ -117,18 +269,42 @@ def api_call(api_method, *args, **kwargs):
     return None
 
 
-def save_json(path: Path, data):
-    """Write data as formatted JSON."""
+async def api_call_async(api_method, *args, **kwargs):
+    """Rate-limited async wrapper around api_call."""
+    loop = asyncio.get_running_loop()
+    async with limiter:
+        return await loop.run_in_executor(
+            None, functools.partial(api_call, api_method, *args, **kwargs)
+        )
+
+
+def _write_json(path: Path, data):
+    """Write data as formatted JSON (runs on the writer pool)."""
+    # orjson serializes datetime/date natively, so no default=str needed
+    _write_bytes(path, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def _write_bytes(path: Path, payload: bytes):
+    """Atomically write raw bytes (runs on the writer pool).
+
+    Writes to a sibling .tmp file and renames over the target, so a crash
+    mid-write never leaves a partial bundle behind.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+
+def save_json(path: Path, data):
+    """Queue data to be written as formatted JSON in the background."""
+    submit_write(_write_json, path, data)
 
 
 def load_sync_state() -> date | None:
     """Load last sync date from state file."""
     if SYNC_STATE_FILE.exists():
-        with open(SYNC_STATE_FILE) as f:
-            state = json.load(f)
+        state = orjson.loads(SYNC_STATE_FILE.read_bytes())
         last = state.get("last_sync_date")
         if last:
             return datetime.strptime(last, "%Y-%m-%d").date()
@@ -136,26 +312,28 @@ def load_sync_state() -> date | None:
 
 
 def save_sync_state(sync_date: date):
-    """Save sync state with current date."""
-    save_json(SYNC_STATE_FILE, {"last_sync_date": sync_date.isoformat()})
-
-
-def sync_daily_data(api: Garmin, start: date, end: date):
-    """Sync per-day health metrics."""
-    daily_calls = [
-        ("summary.json", api.get_user_summary),
-        ("heart_rate.json", api.get_heart_rates),
-        ("sleep.json", api.get_sleep_data),
-        ("stress.json", api.get_all_day_stress),
-        ("respiration.json", api.get_respiration_data),
-        ("spo2.json", api.get_spo2_data),
-        ("hrv.json", api.get_hrv_data),
-        ("training_readiness.json", api.get_training_readiness),
-        ("hydration.json", api.get_hydration_data),
-        ("intensity_minutes.json", api.get_intensity_minutes_data),
-        ("floors.json", api.get_floors),
-        ("steps_detail.json", api.get_steps_data),
-    ]
+    """Save sync state with current date (written synchronously)."""
+    _write_json(SYNC_STATE_FILE, {"last_sync_date": sync_date.isoformat()})
+
+
+async def sync_daily_data(api: Garmin, start: date, end: date):
+    """Sync per-day health metrics, fetching each day's endpoints concurrently.
+
+    Each day is stored as a single zstd-compressed daily/{date}.msgpack.zst
+    file keyed by endpoint name, written once after all of the day's
+    fetches complete.
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def fetch(name: str, method, *args):
+        async with sem:
+            return name, await api_call_async(method, api, *args)
+
+    # One directory scan up front instead of a stat call per day
+    existing_days = set()
+    if DAILY_DIR.is_dir():
+        with os.scandir(DAILY_DIR) as entries:
+            existing_days = {entry.name for entry in entries}
 
     days = (end - start).days + 1
     current = start
@@ -163,148 +341,323 @@ def sync_daily_data(api: Garmin, start: date, end: date):
     while current <= end:
         i += 1
         date_str = current.isoformat()
-        day_dir = BASE_DIR / "daily" / date_str
+        day_path = DAILY_DIR / f"{date_str}.msgpack.zst"
         print(f"Syncing daily data: {date_str}... {i}/{days}")
 
-        for filename, method in daily_calls:
-            filepath = day_dir / filename
-            if filepath.exists():
-                continue
-            data = api_call(method, date_str)
-            if data is not None:
-                save_json(filepath, data)
-            time.sleep(API_DELAY)
-
-        # body_battery takes start+end date params
-        bb_path = day_dir / "body_battery.json"
-        if not bb_path.exists():
-            data = api_call(api.get_body_battery, date_str, date_str)
-            if data is not None:
-                save_json(bb_path, data)
-            time.sleep(API_DELAY)
+        # Re-read any partial day so only missing endpoints are fetched
+        # (uncompressed .msgpack is the pre-zstd layout)
+        day_blob = {}
+        if day_path.name in existing_days:
+            day_blob = raw_map_decoder.decode(dctx.decompress(day_path.read_bytes()))
+        elif f"{date_str}.msgpack" in existing_days:
+            day_blob = raw_map_decoder.decode(
+                (DAILY_DIR / f"{date_str}.msgpack").read_bytes()
+            )
+
+        tasks = [
+            fetch(name, method, date_str)
+            for name, method in DAILY_ENDPOINTS
+            if name not in day_blob
+        ]
+
+        if tasks:
+            results = await asyncio.gather(*tasks)
+            fetched = {name: data for name, data in results if data is not None}
+            if fetched:
+                day_blob.update(fetched)
+                submit_write(
+                    _write_bytes, day_path, cctx.compress(mp_encoder.encode(day_blob))
+                )
 
         current += timedelta(days=1)
 
 
-def sync_activities_full(api: Garmin):
-    """Paginate through all activities (initial sync)."""
+def scan_existing_activities(activities_dir: Path) -> set[str]:
+    """Return the set of already-synced activity IDs from one directory scan."""
+    if not activities_dir.is_dir():
+        return set()
+    with os.scandir(activities_dir) as entries:
+        return {
+            entry.name[:-5] for entry in entries if entry.name.endswith(".json")
+        }
+
+
+def load_activity_index() -> set[str]:
+    """Load the set of already-logged activity IDs.
+
+    Merges the sidecar index with the per-year archives and any legacy
+    per-activity {id}.json files so old archives are never re-fetched.
+    """
+    seen = scan_existing_activities(ACTIVITIES_DIR)
+    if ACTIVITY_INDEX_FILE.exists():
+        seen.update(id_list_decoder.decode(ACTIVITY_INDEX_FILE.read_bytes()))
+    if ACTIVITIES_DIR.is_dir():
+        for archive in ACTIVITIES_DIR.glob("*.msgpack"):
+            if archive.stem.isdigit():
+                seen.update(raw_map_decoder.decode(archive.read_bytes()).keys())
+    return seen
+
+
+def save_activity_index(seen: set[str]):
+    """Persist the activity ID index (written synchronously).
+
+    The index decides what never gets refetched, so main_async() only
+    calls this after every queued NDJSON append has succeeded.
+    """
+    _write_bytes(ACTIVITY_INDEX_FILE, mp_encoder.encode(sorted(seen)))
+
+
+def activity_month(data: dict) -> str:
+    """Return the YYYY-MM an activity belongs to, for log-file routing."""
+    start = (
+        (data.get("summaryDTO") or {}).get("startTimeLocal")
+        or data.get("startTimeLocal")
+        or ""
+    )
+    return start[:7] if len(start) >= 7 else "unknown"
+
+
+def _append_line(path: Path, line: bytes):
+    """Append one raw NDJSON line (runs on the writer pool)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "ab") as f:
+        f.write(line + b"\n")
+
+
+def append_activity(data: dict):
+    """Queue one activity for appending to its monthly NDJSON log."""
+    submit_write(
+        _append_line, ACTIVITIES_DIR / f"{activity_month(data)}.ndjson", orjson.dumps(data)
+    )
+
+
+def append_activity_raw(raw: bytes, summary: dict):
+    """Queue raw activity-detail bytes for appending, routed by the summary's month.
+
+    The bytes go to disk as fetched; they only pass through orjson if they
+    would break the one-record-per-line NDJSON format.
+    """
+    if b"\n" in raw or b"\r" in raw:
+        raw = orjson.dumps(orjson.loads(raw))
+    submit_write(_append_line, ACTIVITIES_DIR / f"{activity_month(summary)}.ndjson", raw)
+
+
+def get_activity_raw(api: Garmin, aid: str) -> bytes:
+    """Fetch an activity's full detail as raw JSON bytes.
+
+    Goes through garth directly so multi-MB GPS payloads skip the
+    dict-decode/re-encode round trip that api.get_activity would do.
+    """
+    return api.garth.request(
+        "GET", "connectapi", f"/activity-service/activity/{aid}", api=True
+    ).content
+
+
+def compact_activity_archives():
+    """Roll completed years' activity records into per-year msgpack archives.
+
+    Legacy per-activity {id}.json files and monthly NDJSON logs from
+    years before the current one are folded into activities/{YYYY}.msgpack
+    (a dict keyed by activityId) and the originals removed. The current
+    year stays in appendable NDJSON form.
+    """
+    if not ACTIVITIES_DIR.is_dir():
+        return
+    current_year = str(date.today().year)
+    by_year: dict[str, dict] = {}
+    compacted = []
+
+    for log in sorted(ACTIVITIES_DIR.glob("*.ndjson")):
+        year = log.name[:4]
+        if not year.isdigit() or year >= current_year:
+            continue
+        with open(log, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                aid = data.get("activityId")
+                if aid is not None:
+                    by_year.setdefault(year, {})[str(aid)] = data
+        compacted.append(log)
+
+    for f in sorted(ACTIVITIES_DIR.glob("*.json")):
+        try:
+            data = orjson.loads(f.read_bytes())
+        except orjson.JSONDecodeError:
+            continue
+        year = activity_month(data)[:4]
+        if not year.isdigit() or year >= current_year:
+            continue
+        aid = data.get("activityId")
+        by_year.setdefault(year, {})[str(aid) if aid is not None else f.stem] = data
+        compacted.append(f)
+
+    if not by_year:
+        return
+
+    for year, records in sorted(by_year.items()):
+        archive = ACTIVITIES_DIR / f"{year}.msgpack"
+        if archive.exists():
+            merged = dict(raw_map_decoder.decode(archive.read_bytes()))
+            merged.update(records)
+            records = merged
+        _write_bytes(archive, mp_encoder.encode(records))
+        print(f"  Archived {len(records)} activities into {archive.name}")
+    for f in compacted:
+        f.unlink()
+
+
+async def sync_activities_full(api: Garmin) -> set[str] | None:
+    """Paginate through all activities (initial sync).
+
+    A producer paginates summary pages while worker coroutines pull
+    activities off a queue and fetch full details concurrently, so paging
+    latency overlaps with detail fetches. Returns the updated ID set for
+    main_async() to persist once all writes are confirmed.
+    """
     print("Syncing all activities (paginated)...")
-    activities_dir = BASE_DIR / "activities"
-    start = 0
-    limit = 100
+    seen = load_activity_index()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=500)
     total = 0
 
-    while True:
-        batch = api_call(api.get_activities, start, limit)
-        if not batch:
-            break
-        for activity in batch:
-            aid = activity.get("activityId")
-            if not aid:
-                continue
-            filepath = activities_dir / f"{aid}.json"
-            if filepath.exists():
+    async def producer():
+        start = 0
+        limit = 100
+        while True:
+            batch = await api_call_async(api.get_activities, start, limit)
+            if not batch:
+                break
+            for activity in batch:
+                if activity.get("activityId"):
+                    await queue.put(activity)
+            if len(batch) < limit:
+                break
+            start += limit
+
+    async def worker():
+        nonlocal total
+        while True:
+            activity = await queue.get()
+            try:
+                aid = str(activity["activityId"])
+                if aid in seen:
+                    total += 1
+                    continue
+                # Fetch full detail, falling back to the summary
+                raw = await api_call_async(get_activity_raw, api, aid)
+                if raw is not None:
+                    append_activity_raw(raw, activity)
+                else:
+                    append_activity(activity)
+                seen.add(aid)
                 total += 1
-                continue
-            # Fetch full detail
-            detail = api_call(api.get_activity, str(aid))
-            if detail is not None:
-                save_json(filepath, detail)
-            else:
-                # Save summary at minimum
-                save_json(filepath, activity)
-            total += 1
-            print(f"  Activity {aid} ({total})")
-            time.sleep(API_DELAY)
-        if len(batch) < limit:
-            break
-        start += limit
-        time.sleep(API_DELAY)
+                print(f"  Activity {aid} ({total})")
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(worker()) for _ in range(MAX_CONCURRENCY)]
+    await producer()
+    await queue.join()
+    for w in workers:
+        w.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
 
     print(f"  {total} activities synced.")
+    return seen
 
 
-def sync_activities_incremental(api: Garmin, start_date: date, end_date: date):
-    """Sync activities for a date range (incremental)."""
+async def sync_activities_incremental(
+    api: Garmin, start_date: date, end_date: date
+) -> set[str] | None:
+    """Sync activities for a date range (incremental).
+
+    Returns the updated ID set when anything new was fetched, for
+    main_async() to persist once all writes are confirmed.
+    """
     print(f"Syncing activities from {start_date} to {end_date}...")
-    activities_dir = BASE_DIR / "activities"
-    activities = api_call(api.get_activities_by_date, start_date.isoformat(), end_date.isoformat())
+    seen = load_activity_index()
+    activities = await api_call_async(
+        api.get_activities_by_date, start_date.isoformat(), end_date.isoformat()
+    )
     if not activities:
         print("  No new activities.")
-        return
+        return None
 
+    new = 0
     for activity in activities:
         aid = activity.get("activityId")
-        if not aid:
-            continue
-        filepath = activities_dir / f"{aid}.json"
-        if filepath.exists():
+        if not aid or str(aid) in seen:
             continue
-        detail = api_call(api.get_activity, str(aid))
-        if detail is not None:
-            save_json(filepath, detail)
+        raw = await api_call_async(get_activity_raw, api, str(aid))
+        if raw is not None:
+            append_activity_raw(raw, activity)
         else:
-            save_json(filepath, activity)
+            append_activity(activity)
+        seen.add(str(aid))
+        new += 1
         print(f"  Activity {aid}")
-        time.sleep(API_DELAY)
 
+    return seen if new else None
 
-def sync_body_composition(api: Garmin, start_date: date, end_date: date):
+
+async def sync_body_composition(api: Garmin, start_date: date, end_date: date):
     """Sync body composition and weigh-in data."""
     print("Syncing body composition...")
-    bc_dir = BASE_DIR / "body_composition"
 
-    data = api_call(api.get_body_composition, start_date.isoformat(), end_date.isoformat())
+    data = await api_call_async(
+        api.get_body_composition, start_date.isoformat(), end_date.isoformat()
+    )
     if data is not None:
-        save_json(bc_dir / "body_comp.json", data)
-
-    time.sleep(API_DELAY)
+        save_json(BODY_COMP_DIR / "body_comp.json", data)
 
-    data = api_call(api.get_weigh_ins, start_date.isoformat(), end_date.isoformat())
+    data = await api_call_async(
+        api.get_weigh_ins, start_date.isoformat(), end_date.isoformat()
+    )
     if data is not None:
-        save_json(bc_dir / "weigh_ins.json", data)
+        save_json(BODY_COMP_DIR / "weigh_ins.json", data)
 
 
-def sync_weekly(api: Garmin):
+async def sync_weekly(api: Garmin):
     """Sync weekly aggregate trends."""
     print("Syncing weekly trends...")
-    weekly_dir = BASE_DIR / "weekly"
     today_str = date.today().isoformat()
 
-    data = api_call(api.get_weekly_steps, today_str, 52)
+    data = await api_call_async(api.get_weekly_steps, today_str, 52)
     if data is not None:
-        save_json(weekly_dir / "steps.json", data)
-    time.sleep(API_DELAY)
+        save_json(WEEKLY_DIR / "steps.json", data)
 
-    data = api_call(api.get_weekly_stress, today_str, 52)
+    data = await api_call_async(api.get_weekly_stress, today_str, 52)
     if data is not None:
-        save_json(weekly_dir / "stress.json", data)
+        save_json(WEEKLY_DIR / "stress.json", data)
 
 
-def sync_profile(api: Garmin):
+async def sync_profile(api: Garmin):
     """Sync user profile and device info."""
     print("Syncing profile...")
-    profile_dir = BASE_DIR / "profile"
 
-    data = api_call(api.get_user_profile)
+    data = await api_call_async(api.get_user_profile)
     if data is not None:
-        save_json(profile_dir / "user_profile.json", data)
-    time.sleep(API_DELAY)
+        save_json(PROFILE_DIR / "user_profile.json", data)
 
-    data = api_call(api.get_devices)
+    data = await api_call_async(api.get_devices)
     if data is not None:
-        save_json(profile_dir / "devices.json", data)
+        save_json(PROFILE_DIR / "devices.json", data)
 
 
-def sync_personal_records(api: Garmin):
+async def sync_personal_records(api: Garmin):
     """Sync personal records."""
     print("Syncing personal records...")
-    data = api_call(api.get_personal_record)
+    data = await api_call_async(api.get_personal_record)
     if data is not None:
-        save_json(BASE_DIR / "personal_records.json", data)
+        save_json(PERSONAL_RECORDS_FILE, data)
 
 
-def main():
+async def main_async():
     api = init_api()
     if not api:
         print("Failed to authenticate.")
@@ -320,37 +673,40 @@ def main():
         start_date = today - timedelta(days=HISTORY_DAYS)
         print(f"Initial sync: {start_date} to {today} ({HISTORY_DAYS} days)")
 
-    # Daily data
-    sync_daily_data(api, start_date, today)
-    time.sleep(API_DELAY)
-
-    # Activities
-    if last_sync:
-        sync_activities_incremental(api, start_date, today)
-    else:
-        sync_activities_full(api)
-    time.sleep(API_DELAY)
-
-    # Body composition
-    sync_body_composition(api, start_date, today)
-    time.sleep(API_DELAY)
-
-    # Weekly trends (always full refresh)
-    sync_weekly(api)
-    time.sleep(API_DELAY)
-
-    # Profile (always refresh)
-    sync_profile(api)
-    time.sleep(API_DELAY)
-
-    # Personal records
-    sync_personal_records(api)
+    # The phases hit different endpoints and share the rate limiter, so
+    # run them concurrently; the small phases hide behind the daily one.
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(sync_daily_data(api, start_date, today))
+        if last_sync:
+            activities = tg.create_task(sync_activities_incremental(api, start_date, today))
+        else:
+            activities = tg.create_task(sync_activities_full(api))
+        tg.create_task(sync_body_composition(api, start_date, today))
+        tg.create_task(sync_weekly(api))  # always full refresh
+        tg.create_task(sync_profile(api))  # always refresh
+        tg.create_task(sync_personal_records(api))
+
+    # Flush pending writes; a failed write must not be recorded as synced
+    writer.shutdown(wait=True)
+    failed = [f.exception() for f in pending_writes if f.exception() is not None]
+    if failed:
+        print(f"\n{len(failed)} background writes failed; first error: {failed[0]}")
+        print("Sync state not saved — affected data will be refetched next run.")
+        sys.exit(1)
 
-    # Save state
+    # Only now is it safe to record what was synced
+    seen = activities.result()
+    if seen is not None:
+        save_activity_index(seen)
+    compact_activity_archives()
     save_sync_state(today)
     print(f"\nSync complete. Data stored in {BASE_DIR}")
 
 
+def main():
+    asyncio.run(main_async())
+
+
 if __name__ == "__main__":
     try:
         main()